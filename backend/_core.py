@@ -0,0 +1,124 @@
+"""
+Compiled numeric core for the single-period calculation
+=========================================================
+
+Numba kernel behind calculations.calculate_analytics. It takes the 13
+P&L / Balance Sheet figures plus the previous period's revenue and
+returns the 21 metrics as a float64 array, in the order of
+calculations._KEYS.
+
+The explicit signature makes Numba compile at import time (or load the
+cached machine code from __pycache__), so the first API request does not
+pay for JIT compilation. build_kernels.py compiles the same function
+ahead of time into the cfs_kernels extension, which calculations.py
+prefers when it is present.
+
+fastmath is deliberately left off: it lets LLVM reassociate the
+arithmetic and assume no NaN/inf, which can flip the 2-decimal rounding
+and the `> 0` guards relative to the NumPy and C paths.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# 13 inputs + previous revenue -> 21 metrics (shared with build_kernels.py)
+SIGNATURE = (
+    'float64[:](float64, float64, float64, float64, float64, float64, float64,'
+    ' float64, float64, float64, float64, float64, float64, float64)'
+)
+
+
+@njit(SIGNATURE, cache=True)
+def _calc(revenue, cogs, overheads, depreciation, interest, tax,
+          cash, receivables, inventory, fixed_assets,
+          cur_liab, noncur_liab, payables, prev_revenue):
+    out = np.empty(21)
+
+    # === GROUP 1: PROFITABILITY (6 metrics) ===
+
+    # 1. Revenue Growth % (prev_revenue == 0 means no previous period)
+    out[0] = (
+        (revenue - prev_revenue) / prev_revenue * 100 if prev_revenue > 0 else 0.0
+    )
+
+    # 2. Gross Margin %
+    gross_margin = revenue - cogs
+    out[1] = gross_margin / revenue * 100 if revenue > 0 else 0.0
+
+    # 3. Operating Profit %
+    operating_profit = gross_margin - overheads
+    out[2] = operating_profit / revenue * 100 if revenue > 0 else 0.0
+
+    # 4. Net Profit %
+    net_profit = operating_profit - interest - tax
+    out[3] = net_profit / revenue * 100 if revenue > 0 else 0.0
+
+    # 5. EBITDA %
+    ebitda = operating_profit + depreciation
+    out[4] = ebitda / revenue * 100 if revenue > 0 else 0.0
+
+    # 6. Interest Coverage
+    out[5] = operating_profit / interest if interest > 0 else 0.0
+
+    # === GROUP 2: WORKING CAPITAL (6 metrics) ===
+
+    # 7-9. Receivable / Inventory / Payable Days
+    out[6] = receivables / revenue * 365 if revenue > 0 else 0.0
+    out[7] = inventory / cogs * 365 if cogs > 0 else 0.0
+    out[8] = payables / cogs * 365 if cogs > 0 else 0.0
+
+    # 10. Working Capital Cycle (Days)
+    out[9] = out[6] + out[7] - out[8]
+
+    # 11. Working Capital per 100 Revenue
+    current_assets = cash + receivables + inventory
+    working_capital = current_assets - cur_liab
+    out[10] = working_capital / revenue * 100 if revenue > 0 else 0.0
+
+    # 12. Current Ratio
+    out[11] = current_assets / cur_liab if cur_liab > 0 else 0.0
+
+    # === GROUP 3: CAPITAL EFFICIENCY (9 metrics) ===
+
+    total_assets = current_assets + fixed_assets
+    total_liabilities = cur_liab + noncur_liab
+    equity = total_assets - total_liabilities
+
+    # 13. Return on Capital %
+    total_capital = working_capital + fixed_assets
+    out[12] = (
+        operating_profit / total_capital * 100 if total_capital > 0 else 0.0
+    )
+
+    # 14. Asset Turnover
+    out[13] = revenue / total_assets if total_assets > 0 else 0.0
+
+    # 15. Return on Equity (ROE) %
+    out[14] = net_profit / equity * 100 if equity > 0 else 0.0
+
+    # 16. Return on Assets (ROA) %
+    out[15] = net_profit / total_assets * 100 if total_assets > 0 else 0.0
+
+    # 17. Fixed Assets Turnover
+    out[16] = revenue / fixed_assets if fixed_assets > 0 else 0.0
+
+    # 18. Debt to Equity
+    out[17] = total_liabilities / equity if equity > 0 else 0.0
+
+    # 19. Debt to Capital
+    total_capital_debt = equity + total_liabilities
+    out[18] = (
+        total_liabilities / total_capital_debt if total_capital_debt > 0 else 0.0
+    )
+
+    # 20. Equity Ratio %
+    out[19] = equity / total_assets * 100 if total_assets > 0 else 0.0
+
+    # 21. Operating Cash Flow
+    out[20] = net_profit + depreciation
+
+    # Round all 21 metrics to 2 decimals in one vectorized pass
+    np.round(out, 2, out)
+
+    return out
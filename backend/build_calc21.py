@@ -0,0 +1,38 @@
+"""
+Build the C calculation kernel
+================================
+
+Compiles calc21.c with cffi into the _calc21 extension module
+(_calc21*.so next to this file). calculations.py prefers it over the
+Numba kernels when it is present.
+
+Usage:
+    cd backend
+    python build_calc21.py
+"""
+
+import os
+import shutil
+import tempfile
+
+from cffi import FFI
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+ffibuilder = FFI()
+ffibuilder.cdef("void calc21(const double *in, double *out);")
+ffibuilder.set_source(
+    "_calc21",
+    "void calc21(const double *in, double *out);",
+    sources=[os.path.join(HERE, "calc21.c")],
+    extra_compile_args=["-O3"],
+    libraries=["m"],
+)
+
+
+if __name__ == "__main__":
+    # Build in a scratch directory and keep only the extension module
+    with tempfile.TemporaryDirectory() as tmpdir:
+        built = ffibuilder.compile(tmpdir=tmpdir, verbose=True)
+        shutil.copy(built, HERE)
@@ -0,0 +1,77 @@
+"""
+Cython build of the pure-Python modules
+=========================================
+
+Compiles models.py and calculations.py with Cython into extension
+modules (models*.so, calculations*.so next to this file). Python's
+import system picks an extension module over the .py source with the
+same name, so the server uses the compiled versions without any
+import changes; when nothing is built the .py files are used as before.
+
+If Cython or a C compiler is not available the build is skipped and
+the dev workflow is unaffected.
+
+Usage:
+    cd backend
+    python build_cython.py
+"""
+
+import os
+import tempfile
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+MODULES = ['models.py', 'calculations.py']
+
+# Only the language level: the modules have no typed buffers, so the
+# boundscheck/wraparound switches would gain nothing, and wraparound=False
+# makes their negative slices (e.g. revenue[:-1]) undefined
+COMPILER_DIRECTIVES = {
+    'language_level': 3,
+}
+
+
+def build() -> bool:
+    """
+    Cythonize MODULES in place
+
+    Returns:
+        True if the extension modules were built, False if the build
+        was skipped and the .py sources stay in use
+    """
+    try:
+        from Cython.Build import cythonize
+        from setuptools import setup
+    except ImportError:
+        print('Cython is not installed, keeping the pure-Python modules')
+        return False
+
+    # Generated .c files and build objects go to a scratch directory;
+    # only the extension modules are copied back next to the sources
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ext_modules = cythonize(
+            [os.path.join(HERE, m) for m in MODULES],
+            build_dir=tmpdir,
+            compiler_directives=COMPILER_DIRECTIVES,
+        )
+        try:
+            setup(
+                name='cfs_backend',
+                ext_modules=ext_modules,
+                script_args=[
+                    'build_ext',
+                    '--build-lib', HERE,
+                    '--build-temp', tmpdir,
+                ],
+            )
+        except (SystemExit, Exception) as e:
+            print(f'Cython build failed ({e}), keeping the pure-Python modules')
+            return False
+
+    return True
+
+
+if __name__ == '__main__':
+    os.chdir(HERE)
+    build()
@@ -0,0 +1,28 @@
+"""
+Ahead-of-time build of the calculation kernel
+===============================================
+
+Compiles _core._calc with numba.pycc into the cfs_kernels extension
+module (cfs_kernels*.so next to this file). calculations.py imports it
+when available, so a server started from a built image never invokes
+the JIT compiler; without it the @njit kernel is used instead.
+
+Usage:
+    cd backend
+    python build_kernels.py
+"""
+
+from numba.pycc import CC
+
+from _core import SIGNATURE, _calc
+
+
+cc = CC('cfs_kernels')
+cc.verbose = True
+
+# Export the plain Python function behind the @njit dispatcher
+cc.export('calc_period', SIGNATURE)(_calc.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
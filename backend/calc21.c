@@ -0,0 +1,80 @@
+/*
+ * C version of the single-period calculation kernel (see _core.py)
+ *
+ * in:  revenue, cost_of_goods, overheads, depreciation, interest_paid,
+ *      tax_paid, cash, accounts_receivable, inventory, fixed_assets,
+ *      current_liabilities, noncurrent_liabilities, accounts_payable,
+ *      previous revenue (0 = no previous period)
+ * out: the 21 metrics in calculations._KEYS order, rounded to 2 decimals
+ *
+ * Built into the _calc21 extension by build_calc21.py.
+ */
+
+#include <math.h>
+
+/* num / den, or 0 when den is not positive */
+#define SAFE_DIV(num, den) ((den) > 0.0 ? (num) / (den) : 0.0)
+
+void calc21(const double *in, double *out)
+{
+    const double revenue = in[0];
+    const double cogs = in[1];
+    const double overheads = in[2];
+    const double depreciation = in[3];
+    const double interest = in[4];
+    const double tax = in[5];
+    const double cash = in[6];
+    const double receivables = in[7];
+    const double inventory = in[8];
+    const double fixed_assets = in[9];
+    const double cur_liab = in[10];
+    const double noncur_liab = in[11];
+    const double payables = in[12];
+    const double prev_revenue = in[13];
+
+    /* === GROUP 1: PROFITABILITY (6 metrics) === */
+    const double gross_margin = revenue - cogs;
+    const double operating_profit = gross_margin - overheads;
+    const double net_profit = operating_profit - interest - tax;
+    const double ebitda = operating_profit + depreciation;
+
+    out[0] = SAFE_DIV(revenue - prev_revenue, prev_revenue) * 100.0;
+    out[1] = SAFE_DIV(gross_margin, revenue) * 100.0;
+    out[2] = SAFE_DIV(operating_profit, revenue) * 100.0;
+    out[3] = SAFE_DIV(net_profit, revenue) * 100.0;
+    out[4] = SAFE_DIV(ebitda, revenue) * 100.0;
+    out[5] = SAFE_DIV(operating_profit, interest);
+
+    /* === GROUP 2: WORKING CAPITAL (6 metrics) === */
+    const double current_assets = cash + receivables + inventory;
+    const double working_capital = current_assets - cur_liab;
+
+    out[6] = SAFE_DIV(receivables, revenue) * 365.0;
+    out[7] = SAFE_DIV(inventory, cogs) * 365.0;
+    out[8] = SAFE_DIV(payables, cogs) * 365.0;
+    out[9] = out[6] + out[7] - out[8];
+    out[10] = SAFE_DIV(working_capital, revenue) * 100.0;
+    out[11] = SAFE_DIV(current_assets, cur_liab);
+
+    /* === GROUP 3: CAPITAL EFFICIENCY (9 metrics) === */
+    const double total_assets = current_assets + fixed_assets;
+    const double total_liabilities = cur_liab + noncur_liab;
+    const double equity = total_assets - total_liabilities;
+    const double total_capital = working_capital + fixed_assets;
+    const double total_capital_debt = equity + total_liabilities;
+
+    out[12] = SAFE_DIV(operating_profit, total_capital) * 100.0;
+    out[13] = SAFE_DIV(revenue, total_assets);
+    out[14] = SAFE_DIV(net_profit, equity) * 100.0;
+    out[15] = SAFE_DIV(net_profit, total_assets) * 100.0;
+    out[16] = SAFE_DIV(revenue, fixed_assets);
+    out[17] = SAFE_DIV(total_liabilities, equity);
+    out[18] = SAFE_DIV(total_liabilities, total_capital_debt);
+    out[19] = SAFE_DIV(equity, total_assets) * 100.0;
+    out[20] = net_profit + depreciation;
+
+    /* Round to 2 decimals the way np.round does (scale, round half to even) */
+    for (int i = 0; i < 21; i++) {
+        out[i] = rint(out[i] * 100.0) / 100.0;
+    }
+}
@@ -5,10 +5,121 @@ Based on real case study data from cashflowstory.com
 Perfect for testing and demonstration purposes.
 """
 
-from typing import List
+from typing import List, Tuple
 from models import FinancialData
 
 
+# Raw period data, validated into FinancialData models below
+_REBECCAS_RAW: Tuple[dict, ...] = (
+    # 2015: Starting year
+    {
+        'company_name': 'Rebeccas Coffee',
+        'period': '2015',
+        
+        # P&L
+        'revenue': 3400000,
+        'cost_of_goods': 2400000,
+        'overheads': 600000,
+        'depreciation': 100000,
+        'interest_paid': 60000,
+        'tax_paid': 60000,
+        
+        # Balance Sheet - Assets
+        'cash': 150000,
+        'accounts_receivable': 800000,
+        'inventory': 900000,
+        'fixed_assets': 1500000,
+        
+        # Balance Sheet - Liabilities
+        'current_liabilities': 700000,
+        'noncurrent_liabilities': 1500000,
+        'accounts_payable': 400000
+    },
+    
+    # 2016: Growth phase
+    {
+        'company_name': 'Rebeccas Coffee',
+        'period': '2016',
+        
+        # P&L
+        'revenue': 4200000,
+        'cost_of_goods': 2900000,
+        'overheads': 750000,
+        'depreciation': 120000,
+        'interest_paid': 75000,
+        'tax_paid': 85000,
+        
+        # Balance Sheet - Assets
+        'cash': 180000,
+        'accounts_receivable': 1100000,
+        'inventory': 1200000,
+        'fixed_assets': 1800000,
+        
+        # Balance Sheet - Liabilities
+        'current_liabilities': 850000,
+        'noncurrent_liabilities': 1700000,
+        'accounts_payable': 550000
+    },
+    
+    # 2017: Rapid expansion
+    {
+        'company_name': 'Rebeccas Coffee',
+        'period': '2017',
+        
+        # P&L
+        'revenue': 5800000,
+        'cost_of_goods': 4100000,
+        'overheads': 950000,
+        'depreciation': 150000,
+        'interest_paid': 95000,
+        'tax_paid': 120000,
+        
+        # Balance Sheet - Assets
+        'cash': 190000,
+        'accounts_receivable': 1400000,
+        'inventory': 1600000,
+        'fixed_assets': 2200000,
+        
+        # Balance Sheet - Liabilities
+        'current_liabilities': 1000000,
+        'noncurrent_liabilities': 1900000,
+        'accounts_payable': 650000
+    },
+    
+    # 2018: Peak year (but challenges emerging)
+    {
+        'company_name': 'Rebeccas Coffee',
+        'period': '2018',
+        
+        # P&L
+        'revenue': 6600000,
+        'cost_of_goods': 4700000,
+        'overheads': 1100000,
+        'depreciation': 180000,
+        'interest_paid': 110000,
+        'tax_paid': 140000,
+        
+        # Balance Sheet - Assets
+        'cash': 200000,
+        'accounts_receivable': 1500000,
+        'inventory': 1800000,
+        'fixed_assets': 2500000,
+        
+        # Balance Sheet - Liabilities
+        'current_liabilities': 1200000,
+        'noncurrent_liabilities': 2100000,
+        'accounts_payable': 750000
+    },
+)
+
+
+# Validated once at import; the models are frozen, so the same instances
+# are served on every get_rebeccas_data() call
+_REBECCAS: Tuple[FinancialData, ...] = tuple(
+    FinancialData.model_validate(d) for d in _REBECCAS_RAW
+)
+
+
 def get_rebeccas_data() -> List[FinancialData]:
     """
     Get Rebeccas Coffee historical data (2015-2018)
@@ -25,107 +136,7 @@ def get_rebeccas_data() -> List[FinancialData]:
         - High debt levels (2.1M non-current liabilities)
     """
     
-    return [
-        # 2015: Starting year
-        FinancialData(
-            company_name="Rebeccas Coffee",
-            period="2015",
-            
-            # P&L
-            revenue=3400000,
-            cost_of_goods=2400000,
-            overheads=600000,
-            depreciation=100000,
-            interest_paid=60000,
-            tax_paid=60000,
-            
-            # Balance Sheet - Assets
-            cash=150000,
-            accounts_receivable=800000,
-            inventory=900000,
-            fixed_assets=1500000,
-            
-            # Balance Sheet - Liabilities
-            current_liabilities=700000,
-            noncurrent_liabilities=1500000,
-            accounts_payable=400000
-        ),
-        
-        # 2016: Growth phase
-        FinancialData(
-            company_name="Rebeccas Coffee",
-            period="2016",
-            
-            # P&L
-            revenue=4200000,
-            cost_of_goods=2900000,
-            overheads=750000,
-            depreciation=120000,
-            interest_paid=75000,
-            tax_paid=85000,
-            
-            # Balance Sheet - Assets
-            cash=180000,
-            accounts_receivable=1100000,
-            inventory=1200000,
-            fixed_assets=1800000,
-            
-            # Balance Sheet - Liabilities
-            current_liabilities=850000,
-            noncurrent_liabilities=1700000,
-            accounts_payable=550000
-        ),
-        
-        # 2017: Rapid expansion
-        FinancialData(
-            company_name="Rebeccas Coffee",
-            period="2017",
-            
-            # P&L
-            revenue=5800000,
-            cost_of_goods=4100000,
-            overheads=950000,
-            depreciation=150000,
-            interest_paid=95000,
-            tax_paid=120000,
-            
-            # Balance Sheet - Assets
-            cash=190000,
-            accounts_receivable=1400000,
-            inventory=1600000,
-            fixed_assets=2200000,
-            
-            # Balance Sheet - Liabilities
-            current_liabilities=1000000,
-            noncurrent_liabilities=1900000,
-            accounts_payable=650000
-        ),
-        
-        # 2018: Peak year (but challenges emerging)
-        FinancialData(
-            company_name="Rebeccas Coffee",
-            period="2018",
-            
-            # P&L
-            revenue=6600000,
-            cost_of_goods=4700000,
-            overheads=1100000,
-            depreciation=180000,
-            interest_paid=110000,
-            tax_paid=140000,
-            
-            # Balance Sheet - Assets
-            cash=200000,
-            accounts_receivable=1500000,
-            inventory=1800000,
-            fixed_assets=2500000,
-            
-            # Balance Sheet - Liabilities
-            current_liabilities=1200000,
-            noncurrent_liabilities=2100000,
-            accounts_payable=750000
-        )
-    ]
+    return list(_REBECCAS)
 
 
 def get_rebeccas_summary() -> dict:
@@ -8,9 +8,70 @@ Defines data structures for:
 - Error responses
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing import Optional, List
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """
+    Current time as an aware UTC datetime (timestamp default for responses)
+    
+    Unlike datetime.now() this needs no local timezone conversion, and
+    unlike the deprecated datetime.utcnow() the result carries its tzinfo.
+    """
+    return datetime.now(timezone.utc)
+
+
+# OpenAPI examples, defined once at module level
+_FINANCIAL_DATA_EXAMPLE = {
+    "company_name": "Acme Corp",
+    "period": "2024-Q4",
+    "revenue": 1000000,
+    "cost_of_goods": 600000,
+    "overheads": 200000,
+    "depreciation": 50000,
+    "interest_paid": 10000,
+    "tax_paid": 30000,
+    "cash": 100000,
+    "accounts_receivable": 150000,
+    "inventory": 200000,
+    "fixed_assets": 500000,
+    "current_liabilities": 120000,
+    "noncurrent_liabilities": 300000,
+    "accounts_payable": 80000
+}
+
+# Analytics of _FINANCIAL_DATA_EXAMPLE (no previous period, so no growth)
+_ANALYTICS_RESPONSE_EXAMPLE = {
+    "input_data": _FINANCIAL_DATA_EXAMPLE,
+    "analytics": {
+        # Group 1: Profitability
+        "revenue_growth_percent": 0.0,
+        "gross_margin_percent": 40.0,
+        "operating_profit_percent": 20.0,
+        "net_profit_percent": 16.0,
+        "ebitda_percent": 25.0,
+        "interest_coverage": 20.0,
+        # Group 2: Working Capital
+        "accounts_receivable_days": 54.75,
+        "inventory_days": 121.67,
+        "accounts_payable_days": 48.67,
+        "working_capital_days": 127.75,
+        "working_capital_per_100": 33.0,
+        "current_ratio": 3.75,
+        # Group 3: Capital Efficiency
+        "return_on_capital": 24.1,
+        "asset_turnover": 1.05,
+        "return_on_equity": 30.19,
+        "return_on_assets": 16.84,
+        "fixed_assets_turnover": 2.0,
+        "debt_to_equity": 0.79,
+        "debt_to_capital": 0.44,
+        "equity_ratio": 55.79,
+        "operating_cash_flow": 210000.0
+    }
+}
 
 
 class FinancialData(BaseModel):
@@ -44,12 +105,15 @@ class FinancialData(BaseModel):
         accounts_payable: Trade payables
     """
     
+    # The gt/ge bounds are enforced inside pydantic-core while each value is
+    # parsed, and they are published as minimums in the OpenAPI schema
+    
     # Metadata
     company_name: str = Field(..., min_length=1, description="Company name")
     period: str = Field(..., description="Period identifier")
     
     # P&L Statement
-    revenue: float = Field(..., ge=0, description="Total revenue")
+    revenue: float = Field(..., gt=0, description="Total revenue")
     cost_of_goods: float = Field(0, ge=0, description="Cost of goods sold")
     overheads: float = Field(0, ge=0, description="Operating expenses")
     depreciation: float = Field(0, ge=0, description="Depreciation & amortization")
@@ -67,32 +131,49 @@ class FinancialData(BaseModel):
     noncurrent_liabilities: float = Field(0, ge=0, description="Non-current liabilities")
     accounts_payable: float = Field(0, ge=0, description="Trade payables")
     
-    @validator('revenue')
-    def revenue_must_be_positive(cls, v):
-        if v <= 0:
-            raise ValueError('Revenue must be greater than 0')
-        return v
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "company_name": "Acme Corp",
-                "period": "2024-Q4",
-                "revenue": 1000000,
-                "cost_of_goods": 600000,
-                "overheads": 200000,
-                "depreciation": 50000,
-                "interest_paid": 10000,
-                "tax_paid": 30000,
-                "cash": 100000,
-                "accounts_receivable": 150000,
-                "inventory": 200000,
-                "fixed_assets": 500000,
-                "current_liabilities": 120000,
-                "noncurrent_liabilities": 300000,
-                "accounts_payable": 80000
-            }
-        }
+    model_config = ConfigDict(
+        extra='forbid',
+        frozen=True,
+        json_schema_extra={"example": _FINANCIAL_DATA_EXAMPLE},
+    )
+
+
+class Analytics(BaseModel):
+    """
+    The 21 calculated financial metrics for one period
+    
+    Field order matches calculations._KEYS. Percentages are in %, ratios
+    are absolute numbers and days are calendar days.
+    """
+    
+    model_config = ConfigDict(frozen=True)
+    
+    # Group 1: Profitability
+    revenue_growth_percent: float = Field(..., description="Revenue growth vs previous period, %")
+    gross_margin_percent: float = Field(..., description="Gross margin, %")
+    operating_profit_percent: float = Field(..., description="Operating profit, %")
+    net_profit_percent: float = Field(..., description="Net profit, %")
+    ebitda_percent: float = Field(..., description="EBITDA margin, %")
+    interest_coverage: float = Field(..., description="Operating profit / interest")
+    
+    # Group 2: Working Capital
+    accounts_receivable_days: float = Field(..., description="Receivable days")
+    inventory_days: float = Field(..., description="Inventory days")
+    accounts_payable_days: float = Field(..., description="Payable days")
+    working_capital_days: float = Field(..., description="Working capital cycle, days")
+    working_capital_per_100: float = Field(..., description="Working capital per 100 of revenue")
+    current_ratio: float = Field(..., description="Current assets / current liabilities")
+    
+    # Group 3: Capital Efficiency
+    return_on_capital: float = Field(..., description="Return on capital, %")
+    asset_turnover: float = Field(..., description="Revenue / total assets")
+    return_on_equity: float = Field(..., description="Return on equity, %")
+    return_on_assets: float = Field(..., description="Return on assets, %")
+    fixed_assets_turnover: float = Field(..., description="Revenue / fixed assets")
+    debt_to_equity: float = Field(..., description="Total liabilities / equity")
+    debt_to_capital: float = Field(..., description="Total liabilities / (equity + liabilities)")
+    equity_ratio: float = Field(..., description="Equity / total assets, %")
+    operating_cash_flow: float = Field(..., description="Net profit + depreciation")
 
 
 class AnalyticsResponse(BaseModel):
@@ -111,27 +192,14 @@ class AnalyticsResponse(BaseModel):
     """
     
     input_data: FinancialData = Field(..., description="Original input data")
-    analytics: Dict[str, float] = Field(..., description="Calculated metrics")
+    analytics: Analytics = Field(..., description="Calculated metrics")
     previous_period: Optional[FinancialData] = Field(None, description="Previous period data")
-    calculated_at: datetime = Field(default_factory=datetime.now, description="Calculation timestamp")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "input_data": {
-                    "company_name": "Acme Corp",
-                    "period": "2024-Q4",
-                    "revenue": 1000000
-                },
-                "analytics": {
-                    "revenue_growth_percent": 15.5,
-                    "gross_margin_percent": 40.0,
-                    "net_profit_percent": 11.0,
-                    "roe": 25.3,
-                    "working_capital_days": 45
-                }
-            }
-        }
+    calculated_at: datetime = Field(default_factory=utc_now, description="Calculation timestamp (UTC)")
+    
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": _ANALYTICS_RESPONSE_EXAMPLE},
+    )
 
 
 class BatchCalculationRequest(BaseModel):
@@ -142,14 +210,10 @@ class BatchCalculationRequest(BaseModel):
     Periods should be sorted chronologically for growth calculations.
     """
     
-    company_name: str = Field(..., description="Company name")
-    periods: List[FinancialData] = Field(..., min_items=1, description="List of periods to calculate")
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
-    @validator('periods')
-    def validate_periods(cls, v):
-        if len(v) < 1:
-            raise ValueError('At least one period required')
-        return v
+    company_name: str = Field(..., description="Company name")
+    periods: List[FinancialData] = Field(..., min_length=1, description="List of periods to calculate")
 
 
 class BatchAnalyticsResponse(BaseModel):
@@ -159,15 +223,30 @@ class BatchAnalyticsResponse(BaseModel):
     Contains calculated analytics for all requested periods.
     """
     
+    # Response models allow extra keys so that documents carrying the
+    # serialized total_periods can be parsed back into the model
+    model_config = ConfigDict(frozen=True)
+    
     company_name: str = Field(..., description="Company name")
     periods: List[AnalyticsResponse] = Field(..., description="Analytics for each period")
-    total_periods: int = Field(default=0, description="Total number of periods")
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        if 'total_periods' not in data or data['total_periods'] == 0:
-            data['total_periods'] = len(data.get('periods', []))
-        self.total_periods = len(self.periods)
+    @computed_field(return_type=int, description="Total number of periods")
+    @property
+    def total_periods(self) -> int:
+        return len(self.periods)
+    
+    @classmethod
+    def from_validated(
+        cls,
+        company_name: str,
+        periods: List[AnalyticsResponse]
+    ) -> "BatchAnalyticsResponse":
+        """
+        Build a response from AnalyticsResponse objects that are already
+        validated, skipping Pydantic's recursive re-validation of every
+        nested period.
+        """
+        return cls.model_construct(company_name=company_name, periods=periods)
 
 
 class ErrorResponse(BaseModel):
@@ -175,6 +254,8 @@ class ErrorResponse(BaseModel):
     Error response model
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Error timestamp (UTC)")
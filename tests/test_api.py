@@ -0,0 +1,185 @@
+"""
+API tests for the FastAPI server
+
+Tests the HTTP endpoints end to end with FastAPI's TestClient:
+- Single-period calculation (ETag / 304 caching)
+- Batch calculation, plain and streamed
+- Demo data endpoint
+- OpenAPI examples
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations import calculate_analytics
+from demo_data import get_rebeccas_data
+from main import app
+from models import AnalyticsResponse, BatchAnalyticsResponse
+
+
+@pytest.fixture
+def client():
+    """Client without the app lifespan (batch work runs in the thread pool)"""
+    return TestClient(app)
+
+
+def _period(period, revenue, **fields):
+    """Minimal FinancialData payload"""
+    return {'company_name': 'Acme', 'period': period, 'revenue': revenue, **fields}
+
+
+class TestCalculateEndpoint:
+    """Test POST /api/calculate caching headers"""
+    
+    def test_same_input_same_etag(self, client):
+        """Test repeated requests get the same ETag and body"""
+        body = {'data': _period('2024', 1000000, cost_of_goods=600000)}
+        first = client.post('/api/calculate', json=body)
+        second = client.post('/api/calculate', json=body)
+        
+        assert first.status_code == second.status_code == 200
+        assert first.headers['etag'] == second.headers['etag']
+        assert first.content == second.content
+        assert first.json()['analytics']['gross_margin_percent'] == 40.0
+    
+    @pytest.mark.parametrize('header', [
+        '{etag}', 'W/{etag}', '"other", {etag}', '*'
+    ])
+    def test_if_none_match_returns_304(self, client, header):
+        """Test a matching If-None-Match (exact, weak, in a list or *) gets 304"""
+        body = {'data': _period('2024', 1000000, cost_of_goods=600000)}
+        etag = client.post('/api/calculate', json=body).headers['etag']
+        
+        response = client.post(
+            '/api/calculate', json=body,
+            headers={'If-None-Match': header.format(etag=etag)}
+        )
+        
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+    
+    def test_different_input_misses_cache(self, client):
+        """Test changed figures produce a new ETag and result"""
+        first = client.post(
+            '/api/calculate',
+            json={'data': _period('2024', 1000000, cost_of_goods=600000)}
+        )
+        second = client.post(
+            '/api/calculate',
+            json={'data': _period('2024', 1000000, cost_of_goods=500000)},
+            headers={'If-None-Match': first.headers['etag']}
+        )
+        
+        assert second.status_code == 200
+        assert second.headers['etag'] != first.headers['etag']
+        assert second.json()['analytics']['gross_margin_percent'] == 50.0
+
+
+def _without_timestamps(document):
+    """Batch document with the calculated_at values removed"""
+    for period in document['periods']:
+        del period['calculated_at']
+    return document
+
+
+class TestBatchEndpoints:
+    """Test POST /api/calculate/batch and /api/calculate/batch/stream"""
+    
+    # Chronological, but not in label string order: the endpoints must keep
+    # the order the client sent
+    REQUEST = {
+        'company_name': 'Acme',
+        'periods': [
+            _period('Nov 2024', 1000000, cost_of_goods=600000, cash=40000),
+            _period('Dec 2024', 2000000, cost_of_goods=1200000, cash=50000),
+            _period('Jan 2025', 3000000, cost_of_goods=1700000, cash=60000),
+        ]
+    }
+    
+    def _check_batch(self, response):
+        """Assert a batch response holds the three periods in request order"""
+        assert response.status_code == 200
+        body = response.json()
+        assert body['company_name'] == 'Acme'
+        assert body['total_periods'] == 3
+        assert [p['input_data']['period'] for p in body['periods']] == [
+            'Nov 2024', 'Dec 2024', 'Jan 2025'
+        ]
+        assert [p['analytics']['revenue_growth_percent'] for p in body['periods']] == [
+            0.0, 100.0, 50.0
+        ]
+    
+    def test_batch_in_process_pool(self):
+        """Test the batch runs in the lifespan's worker process pool"""
+        with TestClient(app) as client:
+            assert main._CPU_POOL is not None
+            self._check_batch(client.post('/api/calculate/batch', json=self.REQUEST))
+        
+        assert main._CPU_POOL is None
+    
+    def test_batch_without_pool(self, client):
+        """Test the batch falls back to the thread pool without the lifespan"""
+        assert main._CPU_POOL is None
+        self._check_batch(client.post('/api/calculate/batch', json=self.REQUEST))
+    
+    def test_stream_matches_batch(self, client):
+        """Test the streamed document parses and equals the batch response"""
+        batch = client.post('/api/calculate/batch', json=self.REQUEST)
+        stream = client.post('/api/calculate/batch/stream', json=self.REQUEST)
+        
+        assert batch.status_code == stream.status_code == 200
+        streamed = stream.json()
+        
+        # One timestamp per batch, as in the non-streaming endpoint
+        assert len({p['calculated_at'] for p in streamed['periods']}) == 1
+        assert _without_timestamps(streamed) == _without_timestamps(batch.json())
+        self._check_batch(stream)
+    
+    def test_stream_error_before_first_chunk(self, client, monkeypatch):
+        """Test a calculation failure gives a 500, not truncated JSON"""
+        def fail(*args):
+            raise ValueError('boom')
+        monkeypatch.setattr(main, 'calculate_analytics', fail)
+        
+        response = client.post('/api/calculate/batch/stream', json=self.REQUEST)
+        
+        assert response.status_code == 500
+        assert 'boom' in response.json()['detail']
+
+
+class TestDemoEndpoint:
+    """Test GET /api/demo/rebeccas"""
+    
+    def test_inputs_are_floats(self, client):
+        """Test demo inputs are serialized as floats like every other endpoint"""
+        response = client.get('/api/demo/rebeccas')
+        
+        assert response.status_code == 200
+        input_data = response.json()['periods'][0]['input_data']
+        assert input_data['revenue'] == 3400000.0
+        assert isinstance(input_data['revenue'], float)
+        assert isinstance(input_data['cash'], float)
+    
+    def test_response_round_trip(self, client):
+        """Test the served document parses back into BatchAnalyticsResponse"""
+        document = client.get('/api/demo/rebeccas').json()
+        parsed = BatchAnalyticsResponse.model_validate(document)
+        
+        assert parsed.total_periods == document['total_periods'] == 4
+        assert [p.input_data for p in parsed.periods] == get_rebeccas_data()
+
+
+class TestOpenAPIExamples:
+    """Test the published schema examples are valid responses"""
+    
+    def test_analytics_response_example(self, client):
+        """Test the AnalyticsResponse example validates and matches the formulas"""
+        schemas = client.get('/openapi.json').json()['components']['schemas']
+        example = schemas['AnalyticsResponse']['example']
+        
+        response = AnalyticsResponse.model_validate(example)
+        assert response.analytics.model_dump() == calculate_analytics(
+            example['input_data']
+        )
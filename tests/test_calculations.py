@@ -9,84 +9,157 @@ Tests all 21 financial formulas with various scenarios:
 """
 
 import pytest
-import sys
-import os
+import numpy as np
+import pandas as pd
+import polars as pl
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+from calculations import (
+    calculate_analytics, calculate_analytics_batch, calculate_analytics_df,
+    calculate_analytics_periods, calculate_analytics_pl
+)
+from models import FinancialData
 
-from calculations import calculate_analytics
 
+@pytest.mark.parametrize('data,key,expected', [
+    # Group 1: Profitability
+    # (1000000 - 600000) / 1000000 * 100 = 40%
+    pytest.param(
+        {'revenue': 1000000, 'cost_of_goods': 600000},
+        'gross_margin_percent', 40.0,
+        id='gross_margin_percent'
+    ),
+    # (1000000 - 600000 - 200000 - 10000 - 30000) / 1000000 * 100 = 16%
+    pytest.param(
+        {'revenue': 1000000, 'cost_of_goods': 600000, 'overheads': 200000,
+         'interest_paid': 10000, 'tax_paid': 30000},
+        'net_profit_percent', 16.0,
+        id='net_profit_percent'
+    ),
+    # Group 2: Working Capital
+    # 1000000 / 3650000 * 365 = 100 days (revenue of 10,000 per day)
+    pytest.param(
+        {'revenue': 3650000, 'accounts_receivable': 1000000},
+        'accounts_receivable_days', 100.0,
+        id='accounts_receivable_days'
+    ),
+    # Group 3: Capital Efficiency
+    # Net Profit = 160000, Equity = 500000 -> ROE = 32%
+    pytest.param(
+        {'revenue': 1000000, 'cost_of_goods': 600000, 'overheads': 200000,
+         'interest_paid': 10000, 'tax_paid': 30000, 'cash': 100000,
+         'accounts_receivable': 200000, 'inventory': 200000,
+         'fixed_assets': 500000, 'current_liabilities': 200000,
+         'noncurrent_liabilities': 300000},
+        'return_on_equity', 32.0,
+        id='return_on_equity'
+    ),
+])
+def test_metric(data, key, expected):
+    """Test a single metric against its hand-calculated value"""
+    assert calculate_analytics(data)[key] == pytest.approx(expected, rel=0.01)
 
-class TestProfitabilityMetrics:
-    """Test Group 1: Profitability metrics"""
+
+class TestInputTypes:
+    """Test calculate_analytics accepts Pydantic models as well as dicts"""
     
-    def test_gross_margin_percent(self):
-        """Test gross margin calculation"""
-        data = {
-            'revenue': 1000000,
-            'cost_of_goods': 600000
-        }
-        result = calculate_analytics(data)
+    def test_model_matches_dict(self):
+        """Test a FinancialData model gives the same result as its dict"""
+        current = FinancialData(
+            company_name='Acme', period='2024', revenue=1200000,
+            cost_of_goods=700000, overheads=250000, cash=100000,
+            accounts_receivable=180000, current_liabilities=90000
+        )
+        previous = FinancialData(company_name='Acme', period='2023', revenue=1000000)
         
-        # Expected: (1000000 - 600000) / 1000000 * 100 = 40%
-        assert result['gross_margin_percent'] == pytest.approx(40.0, rel=0.01)
+        assert calculate_analytics(current, previous) == calculate_analytics(
+            current.model_dump(), previous.model_dump()
+        )
+        assert calculate_analytics(current, previous)['revenue_growth_percent'] == 20.0
     
-    def test_net_profit_percent(self):
-        """Test net profit calculation"""
-        data = {
-            'revenue': 1000000,
-            'cost_of_goods': 600000,
-            'overheads': 200000,
-            'interest_paid': 10000,
-            'tax_paid': 30000
-        }
-        result = calculate_analytics(data)
+    def test_repeated_call_returns_fresh_dict(self):
+        """Test mutating a (cached) result does not leak into later calls"""
+        data = {'revenue': 1000000, 'cost_of_goods': 600000}
+        first = calculate_analytics(data)
+        first['gross_margin_percent'] = -1
         
-        # Expected: (1000000 - 600000 - 200000 - 10000 - 30000) / 1000000 * 100 = 16%
-        assert result['net_profit_percent'] == pytest.approx(16.0, rel=0.01)
+        assert calculate_analytics(data)['gross_margin_percent'] == 40.0
 
 
-class TestWorkingCapitalMetrics:
-    """Test Group 2: Working Capital metrics"""
+class TestBatchCalculation:
+    """Test vectorized DataFrame path against the single-period path"""
     
-    def test_accounts_receivable_days(self):
-        """Test AR days calculation"""
-        data = {
-            'revenue': 3650000,  # 10,000 per day
-            'accounts_receivable': 1000000
-        }
-        result = calculate_analytics(data)
+    def test_matches_single_period(self):
+        """Test DataFrame results agree with calculate_analytics per period"""
+        periods = [
+            {'period': '2023', 'revenue': 1000000, 'cost_of_goods': 600000,
+             'overheads': 200000, 'depreciation': 50000, 'interest_paid': 10000,
+             'tax_paid': 30000, 'cash': 100000, 'accounts_receivable': 150000,
+             'inventory': 200000, 'fixed_assets': 500000,
+             'current_liabilities': 120000, 'noncurrent_liabilities': 300000,
+             'accounts_payable': 80000},
+            {'period': '2024', 'revenue': 1200000, 'cost_of_goods': 700000,
+             'overheads': 250000, 'depreciation': 0, 'interest_paid': 0,
+             'tax_paid': 40000, 'cash': 0, 'accounts_receivable': 180000,
+             'inventory': 0, 'fixed_assets': 0,
+             'current_liabilities': 0, 'noncurrent_liabilities': 0,
+             'accounts_payable': 90000},
+        ]
+        # Feed periods out of order: the DataFrame path sorts by period
+        result = calculate_analytics_df(pd.DataFrame(periods[::-1]))
         
-        # Expected: 1000000 / 3650000 * 365 = 100 days
-        assert result['accounts_receivable_days'] == pytest.approx(100.0, rel=0.01)
-
-
-class TestCapitalEfficiencyMetrics:
-    """Test Group 3: Capital Efficiency metrics"""
+        assert list(result['period']) == ['2023', '2024']
+        for i, data in enumerate(periods):
+            expected = calculate_analytics(data, periods[i - 1] if i else None)
+            for key, value in expected.items():
+                assert result.loc[i, key] == pytest.approx(value, abs=0.011)
+        
+        # Re-running on a result frame replaces the metrics, not duplicates them
+        rerun = calculate_analytics_df(result)
+        assert list(rerun.columns) == list(result.columns)
+        
+        # The Polars implementation produces the same frame
+        result_pl = calculate_analytics_pl(pl.DataFrame(periods[::-1]))
+        assert result_pl.columns == list(result.columns)
+        for key in expected:
+            assert result_pl[key].to_list() == result[key].tolist()
+        
+        # inplace=True fills the caller's frame with the same result
+        df = pd.DataFrame(periods[::-1])
+        assert calculate_analytics_df(df, inplace=True) is df
+        assert df.equals(result)
+        
+        # Column arrays (already in period order) give the same metrics
+        cols = {key: np.array([p[key] for p in periods], dtype=float)
+                for key in periods[0] if key != 'period'}
+        result_np = calculate_analytics_batch(cols)
+        for key in expected:
+            assert result_np[key].tolist() == result[key].tolist()
+        
+        # Dicts or models in period order give one metrics dict per period
+        rows = calculate_analytics_periods(periods)
+        assert rows == calculate_analytics_periods(
+            [FinancialData(company_name='Acme', **p) for p in periods]
+        )
+        assert rows == result[list(expected)].to_dict(orient='records')
     
-    def test_return_on_equity(self):
-        """Test ROE calculation"""
-        data = {
-            'revenue': 1000000,
-            'cost_of_goods': 600000,
-            'overheads': 200000,
-            'interest_paid': 10000,
-            'tax_paid': 30000,
-            'cash': 100000,
-            'accounts_receivable': 200000,
-            'inventory': 200000,
-            'fixed_assets': 500000,
-            'current_liabilities': 200000,
-            'noncurrent_liabilities': 300000
-        }
-        result = calculate_analytics(data)
+    @pytest.mark.filterwarnings('error')
+    def test_non_finite_inputs(self):
+        """Test non-finite inputs give 0 metrics without NumPy warnings"""
+        rows = [
+            {'period': '2023', 'revenue': 1e308, 'cost_of_goods': -1e308,
+             'overheads': np.inf, 'depreciation': np.nan, 'interest_paid': 0.0,
+             'tax_paid': 0.0, 'cash': 0.0, 'accounts_receivable': 0.0,
+             'inventory': 0.0, 'fixed_assets': 0.0, 'current_liabilities': 0.0,
+             'noncurrent_liabilities': 0.0, 'accounts_payable': 0.0},
+        ]
+        result = calculate_analytics_df(pd.DataFrame(rows))
         
-        # Net Profit = 160000
-        # Equity = 500000
-        # ROE = 32%
-        assert result['return_on_equity'] == pytest.approx(32.0, rel=0.01)
-
+        assert np.isfinite(result['operating_profit_percent']).all()
+        assert result.loc[0, 'operating_cash_flow'] == 0
+        
+        # The Polars implementation zeroes the same values
+        result_pl = calculate_analytics_pl(pl.DataFrame(rows))
+        for key in ('operating_profit_percent', 'net_profit_percent',
+                    'operating_cash_flow', 'gross_margin_percent'):
+            assert result_pl[key].to_list() == result[key].tolist()
 
-if __name__ == '__main__':
-    pytest.main([__file__, '-v'])